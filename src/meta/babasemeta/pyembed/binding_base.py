@@ -19,7 +19,7 @@ from babase import (
 )
 
 # The C++ layer looks for this variable:
-values = [
+values = (
     _hooks.reset_to_main_menu,  # kResetToMainMenuCall
     _hooks.store_config_fullscreen_on,  # kStoreConfigFullscreenOnCall
     _hooks.store_config_fullscreen_off,  # kStoreConfigFullscreenOffCall
@@ -89,4 +89,4 @@ values = [
     _env.on_native_module_import,  # kEnvOnNativeModuleImportCall
     _env.on_main_thread_start_app,  # kOnMainThreadStartAppCall
     _ui.DevConsoleStringEditAdapter,  # kDevConsoleStringEditAdapterClass
-]
+)
@@ -6,7 +6,7 @@ from __future__ import annotations
 from babase import app
 
 # The C++ layer looks for this variable:
-values = [
+values = (
     app,  # kApp
     app.handle_deep_link,  # kAppHandleDeepLinkCall
     app.lang.get_resource,  # kGetResourceCall
@@ -21,4 +21,4 @@ values = [
     app.on_native_active_changed,  # kAppOnNativeActiveChangedCall
     app.read_config,  # kAppReadConfigCall
     app.devconsole.do_refresh_tab,  # kAppDevConsoleDoRefreshTabCall
-]
+)
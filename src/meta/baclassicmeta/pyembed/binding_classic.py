@@ -8,7 +8,7 @@ from baclassic._music import do_play_music
 from baclassic._input import get_input_device_mapped_value
 
 # The C++ layer looks for this variable:
-values = [
+values = (
     do_play_music,  # kDoPlayMusicCall
     get_input_device_mapped_value,  # kGetInputDeviceMappedValueCall
-]
+)
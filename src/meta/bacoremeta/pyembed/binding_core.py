@@ -10,7 +10,7 @@ import logging
 import sys
 
 # The C++ layer looks for this variable:
-values = [
+values = (
     sys.modules['__main__'].__dict__,  # kMainDict
     tuple(),  # kEmptyTuple
     copy.deepcopy,  # kDeepCopyCall
@@ -22,4 +22,4 @@ values = [
     logging.warning,  # kLoggingWarningCall
     logging.error,  # kLoggingErrorCall
     logging.critical,  # kLoggingCriticalCall
-]
+)
@@ -14,7 +14,7 @@ from bascenev1._net import HostInfo
 import _bascenev1
 
 # The C++ layer looks for this variable:
-values = [
+values = (
     _hooks.launch_main_menu_session,  # kLaunchMainMenuSessionCall
     _hooks.get_player_icon,  # kGetPlayerIconCall
     _hooks.filter_chat_message,  # kFilterChatMessageCall
@@ -32,4 +32,4 @@ values = [
     Activity,  # kActivityClass
     Session,  # kSceneV1SessionClass
     HostInfo,  # kHostInfoClass
-]
+)
@@ -8,6 +8,6 @@ from __future__ import annotations
 from batemplatefs import _hooks
 
 # The C++ layer looks for this variable:
-values = [
+values = (
     _hooks.hello_world,  # kHelloWorldCall
-]
+)
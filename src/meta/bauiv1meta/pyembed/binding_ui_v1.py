@@ -9,7 +9,7 @@ from bauiv1 import _hooks
 from bauiv1._uitypes import TextWidgetStringEditAdapter
 
 # The C++ layer looks for this variable:
-values = [
+values = (
     bauiv1.onscreenkeyboard.OnScreenKeyboardWindow,  # kOnScreenKeyboardClass
     _hooks.ticket_icon_press,  # kTicketIconPressCall
     _hooks.trophy_icon_press,  # kTrophyIconPressCall
@@ -24,4 +24,4 @@ values = [
     _hooks.show_url_window,  # kShowURLWindowCall
     _hooks.double_transition_out_warning,  # kDoubleTransitionOutWarningCall
     TextWidgetStringEditAdapter,  # kTextWidgetStringEditAdapterClass
-]
+)
@@ -97,13 +97,14 @@ def gen_binding_code(projroot: str, in_path: str, out_path: str) -> None:
     # Then it grabs the 'values' var that should have been defined.
     ccode += (
         '\n'
-        "// Grab the 'values' list that the binding code created.\n"
+        "// Grab the 'values' tuple that the binding code created.\n"
         'auto bindvals = ctx.DictGetItem("values");\n'
-        'if (!bindvals.Exists() || !PyList_Check(*bindvals)) {\n'
+        'if (!bindvals.Exists() || !PyTuple_Check(*bindvals)\n'
+        f'    || PyTuple_GET_SIZE(*bindvals) != {len(entries)}) {{\n'
         '  FatalError("Error binding required Python objects.");\n'
         '}\n'
         '\n'
-        '// Pull our various obj_ values from the values list.\n'
+        '// Pull our various obj_ values from the values tuple.\n'
     )
 
     # Then it pulls the individual values out of the returned tuple.
@@ -115,7 +116,7 @@ def gen_binding_code(projroot: str, in_path: str, out_path: str) -> None:
         )
         ccode += (
             f'{storecmd}(ObjID::{entry[1]},'
-            f' PyList_GET_ITEM(bindvals.Get(), {i}));\n'
+            f' PyTuple_GET_ITEM(bindvals.Get(), {i}));\n'
         )
 
     ccode += '}\n'